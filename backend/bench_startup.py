@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark
+- uvicorn 프로세스를 새로 띄우고 첫 /api/health 응답까지의 시간을 측정
+- 이어서 DB를 쓰는 첫 요청(/api/settings/threshold)까지의 시간을 측정
+  (엔진 생성, 드라이버 import, 첫 연결이 여기에 포함됨)
+    cd backend && python bench_startup.py --runs 5 --target 3.0
+- DB 요청까지의 중앙값이 목표 시간(--target)을 넘기면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+DB_PATH = "/api/settings/threshold"
+
+
+def measure_once(timeout: float) -> dict:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    url = f"{base_url}/api/health"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+            if time.perf_counter() - started > timeout:
+                raise TimeoutError(f"no response from {url} within {timeout}s")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as res:
+                    body = json.load(res)
+                break
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.02)
+        cold_start = time.perf_counter() - started
+
+        with urllib.request.urlopen(base_url + DB_PATH, timeout=timeout) as res:
+            res.read()
+        return {
+            "coldStartSeconds": cold_start,
+            "firstDbRequestSeconds": time.perf_counter() - started,
+            **body,
+        }
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure API cold-start time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--target", type=float, default=None,
+                        help="max median time to the first DB-backed response (s)")
+    args = parser.parse_args()
+
+    runs = []
+    for i in range(args.runs):
+        result = measure_once(args.timeout)
+        runs.append(result)
+        print(
+            f"run {i + 1}: cold start {result['coldStartSeconds']:.3f}s, "
+            f"first DB request {result['firstDbRequestSeconds']:.3f}s "
+            f"(import {result['importSeconds']:.3f}s, "
+            f"ready {result['startupSeconds']:.3f}s, "
+            f"first request {result['firstRequestSeconds']:.3f}s)"
+        )
+
+    for label, key in [("cold start", "coldStartSeconds"), ("first DB request", "firstDbRequestSeconds")]:
+        values = [r[key] for r in runs]
+        print(f"{label} median {statistics.median(values):.3f}s, "
+              f"min {min(values):.3f}s, max {max(values):.3f}s")
+
+    median = statistics.median(r["firstDbRequestSeconds"] for r in runs)
+    if args.target is not None and median > args.target:
+        print(f"FAIL: median time to first DB request exceeds target {args.target:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,3 +13,11 @@ CORS_ORIGINS = os.getenv(
 
 ADMIN_CODE = os.getenv("ADMIN_CODE", "graspfit2026")
 ROOT_CODE = os.getenv("ROOT_CODE", "")  # Must be set explicitly to enable root login
+
+# Run pending schema migrations on app startup. Production runs `python migrate.py`
+# once per deploy instead; local SQLite keeps the old zero-setup behaviour.
+# Safe with several workers on Postgres (advisory lock); single-process only on SQLite.
+AUTO_MIGRATE = os.getenv(
+    "AUTO_MIGRATE",
+    "1" if DATABASE_URL.startswith("sqlite") else "0",
+) == "1"
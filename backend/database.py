@@ -1,18 +1,30 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from config import DATABASE_URL
 
-connect_args = {}
-if DATABASE_URL.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
+_engine: Engine | None = None
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args=connect_args,
-    pool_pre_ping=True,
-    pool_recycle=300,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_engine() -> Engine:
+    """Create the engine on first use so importing the app never touches the DB driver."""
+    global _engine
+    if _engine is None:
+        connect_args = {}
+        if DATABASE_URL.startswith("sqlite"):
+            connect_args["check_same_thread"] = False
+
+        _engine = create_engine(
+            DATABASE_URL,
+            connect_args=connect_args,
+            pool_pre_ping=True,
+            pool_recycle=300,
+        )
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 
 class Base(DeclarativeBase):
@@ -20,6 +32,7 @@ class Base(DeclarativeBase):
 
 
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -3,15 +3,25 @@ Modigrip (GraspFit) Backend API
 - 사용자 관리, 연습 기록 저장, 통계/연구자 대시보드
 """
 
+from time import perf_counter
+
+_IMPORT_STARTED = perf_counter()  # before the heavy imports below
+
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import Numeric, and_, case, cast, func, or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+from contextlib import asynccontextmanager
+from typing import Optional
+import logging
 import os
 
-from database import engine, get_db, Base
+from database import get_db, get_engine
 from models import User, PracticeRecord, Feedback, AppSetting
 from schemas import (
     UserCreate, UserResponse,
@@ -19,12 +29,49 @@ from schemas import (
     UserStats, DailyStat,
     FeedbackCreate, FeedbackResponse,
 )
-from config import CORS_ORIGINS, ADMIN_CODE, ROOT_CODE
+from config import CORS_ORIGINS, ADMIN_CODE, ROOT_CODE, AUTO_MIGRATE
+
+logger = logging.getLogger("uvicorn.error")
+
+# Cold-start timings (seconds since this module started importing)
+startup_metrics: dict[str, Optional[float]] = {
+    "importSeconds": None,
+    "startupSeconds": None,
+    "firstRequestSeconds": None,
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes run once per deploy via `python migrate.py`;
+    # the DB connection itself is opened lazily by the first request.
+    if AUTO_MIGRATE:
+        from migrations import upgrade
+        upgrade(get_engine())
+    _mount_frontend(app)
+
+    startup_metrics["startupSeconds"] = round(perf_counter() - _IMPORT_STARTED, 4)
+    logger.info(
+        "Startup: import %.3fs, ready %.3fs",
+        startup_metrics["importSeconds"], startup_metrics["startupSeconds"],
+    )
+    yield
+
+
+class FirstRequestTimer:
+    """Pure ASGI pass-through that stamps firstRequestSeconds once."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and startup_metrics["firstRequestSeconds"] is None:
+            startup_metrics["firstRequestSeconds"] = round(perf_counter() - _IMPORT_STARTED, 4)
+            logger.info("First request received %.3fs after import", startup_metrics["firstRequestSeconds"])
+        await self.app(scope, receive, send)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Modigrip API", version="1.0.0")
+app = FastAPI(title="Modigrip API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +80,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(FirstRequestTimer)
+
+
+@app.get("/api/health")
+def health():
+    return {"status": "ok", **startup_metrics}
+
+
+@app.get("/api/health/ready")
+def health_ready(db: Session = Depends(get_db)):
+    # Readiness: opens (or pre-pings) a pooled DB connection
+    try:
+        db.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"status": "ok", **startup_metrics}
 
 
 # ── Helper: verify admin role ──────────────────────────────
@@ -172,6 +235,24 @@ def get_records(user_id: int = Query(...), db: Session = Depends(get_db)):
 
 # ── Stats ──────────────────────────────────────────────────
 
+DAILY_GOAL_SECONDS = 1200  # 20분 이상 연습한 날만 주간 연습일로 인정
+WEEKLY_GOAL_DAYS = 3
+
+
+def _weekly_window_start(now: datetime) -> datetime:
+    """First UTC midnight inside the last 7 days (naive, like stored created_at)."""
+    week_start = now - timedelta(days=7)
+    first_day = week_start.date()
+    if week_start.time() != time.min:
+        first_day += timedelta(days=1)
+    return datetime.combine(first_day, time.min)
+
+
+def _round_half_up(value: float) -> float:
+    # Matches SQL round(numeric, 1) used by the admin list (166.85 -> 166.9, not 166.8)
+    return float(Decimal(repr(value)).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP))
+
+
 def _build_user_stats(records: list[PracticeRecord]) -> UserStats:
     if not records:
         return UserStats(
@@ -203,22 +284,21 @@ def _build_user_stats(records: list[PracticeRecord]) -> UserStats:
         for day, d in sorted(daily.items(), reverse=True)
     ]
 
-    # Weekly days
-    now = datetime.now(timezone.utc)
-    week_start = now - timedelta(days=7)
+    # Weekly days (same window as the admin dashboard query)
+    window_start = _weekly_window_start(datetime.now(timezone.utc))
     weekly_days = 0
     for day, d in daily.items():
         try:
-            day_dt = datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            if day_dt >= week_start and d["seconds"] >= 1200:
+            day_dt = datetime.strptime(day, "%Y-%m-%d")
+            if day_dt >= window_start and d["seconds"] >= DAILY_GOAL_SECONDS:
                 weekly_days += 1
         except ValueError:
             pass
 
     return UserStats(
         totalSessions=total_sessions,
-        totalMinutes=round(total_minutes, 1),
-        correctRate=round(avg_correct_rate, 1),
+        totalMinutes=_round_half_up(total_minutes),
+        correctRate=_round_half_up(avg_correct_rate),
         weeklyDays=weekly_days,
         dailyStats=daily_stats,
     )
@@ -237,33 +317,163 @@ def get_stats(user_id: int, db: Session = Depends(get_db)):
 
 # ── Admin: Students Dashboard ──────────────────────────────
 
+def _prefix_match(column, prefix: str, dialect: str):
+    """Case-insensitive prefix match on lower(column), served by the lower() prefix indexes."""
+    lowered = func.lower(column)
+    prefix = prefix.lower()
+    clause = lowered.startswith(prefix, autoescape=True)
+    if dialect == "sqlite":
+        # SQLite never seeks an expression index for LIKE; the equivalent range lets it
+        clause = and_(clause, lowered >= prefix, lowered < prefix + "\U0010ffff")
+    return clause
+
+
+def _round1(expr):
+    # Postgres only has round(numeric, int); filters, sorting and output share these values
+    return func.round(cast(expr, Numeric), 1)
+
+
+ADMIN_STUDENT_SORT_KEYS = (
+    "userId", "name", "studentId",
+    "totalSessions", "totalMinutes", "correctRate", "weeklyDays",
+)
+
+
 @app.get("/api/admin/students")
-def admin_students(admin_id: int = Query(...), db: Session = Depends(get_db)):
+def admin_students(
+    admin_id: int = Query(...),
+    q: Optional[str] = Query(None, max_length=100),
+    meets_weekly_goal: Optional[bool] = Query(None),
+    min_correct_rate: Optional[float] = Query(None, ge=0, le=100),
+    max_correct_rate: Optional[float] = Query(None, ge=0, le=100),
+    min_total_minutes: Optional[float] = Query(None, ge=0),
+    max_total_minutes: Optional[float] = Query(None, ge=0),
+    sort: str = Query("userId"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
     require_admin(admin_id, db)
+    if sort not in ADMIN_STUDENT_SORT_KEYS:
+        raise HTTPException(status_code=400, detail="Invalid sort key")
 
-    students = db.query(User).filter(User.role == "student").all()
     now = datetime.now(timezone.utc)
 
-    result = []
-    for student in students:
-        records = db.query(PracticeRecord).filter(
-            PracticeRecord.user_id == student.id
-        ).all()
-        stats = _build_user_stats(records)
+    # Candidate students: case-insensitive prefix search on name / studentId
+    candidates = select(User.id).where(User.role == "student")
+    if q and q.strip():
+        prefix = q.strip()
+        dialect = db.get_bind().dialect.name
+        candidates = candidates.where(or_(
+            _prefix_match(User.name, prefix, dialect),
+            _prefix_match(User.student_id, prefix, dialect),
+        ))
+
+    # Aggregates are computed only over the candidates' records
+    totals = (
+        select(
+            PracticeRecord.user_id.label("user_id"),
+            func.count(PracticeRecord.id).label("total_sessions"),
+            func.sum(PracticeRecord.duration_seconds).label("total_seconds"),
+            func.avg(PracticeRecord.correct_rate).label("correct_rate"),
+        )
+        .where(PracticeRecord.user_id.in_(candidates))
+        .group_by(PracticeRecord.user_id)
+        .subquery()
+    )
+
+    day = func.date(PracticeRecord.created_at)
+    goal_days = (
+        select(PracticeRecord.user_id.label("user_id"), day.label("day"))
+        .where(
+            PracticeRecord.user_id.in_(candidates),
+            PracticeRecord.created_at >= _weekly_window_start(now),
+        )
+        .group_by(PracticeRecord.user_id, day)
+        .having(func.sum(PracticeRecord.duration_seconds) >= DAILY_GOAL_SECONDS)
+        .subquery()
+    )
+    weekly = (
+        select(goal_days.c.user_id, func.count().label("weekly_days"))
+        .group_by(goal_days.c.user_id)
+        .subquery()
+    )
+
+    total_sessions = func.coalesce(totals.c.total_sessions, 0)
+    total_minutes = _round1(func.coalesce(totals.c.total_seconds, 0) / 60.0)
+    correct_rate = _round1(func.coalesce(totals.c.correct_rate, 0.0))
+    weekly_days = func.coalesce(weekly.c.weekly_days, 0)
+
+    query = (
+        db.query(User, total_sessions, total_minutes, correct_rate, weekly_days)
+        .outerjoin(totals, totals.c.user_id == User.id)
+        .outerjoin(weekly, weekly.c.user_id == User.id)
+        .filter(User.id.in_(candidates))
+    )
+
+    if meets_weekly_goal is not None:
+        query = query.filter(
+            weekly_days >= WEEKLY_GOAL_DAYS if meets_weekly_goal
+            else weekly_days < WEEKLY_GOAL_DAYS
+        )
+    if min_correct_rate is not None:
+        query = query.filter(correct_rate >= min_correct_rate)
+    if max_correct_rate is not None:
+        query = query.filter(correct_rate <= max_correct_rate)
+    if min_total_minutes is not None:
+        query = query.filter(total_minutes >= min_total_minutes)
+    if max_total_minutes is not None:
+        query = query.filter(total_minutes <= max_total_minutes)
+
+    # Summary over every matching student, not just the requested page
+    total, goal_met, avg_rate = query.with_entities(
+        func.count(User.id),
+        func.coalesce(func.sum(case((weekly_days >= WEEKLY_GOAL_DAYS, 1), else_=0)), 0),
+        func.avg(correct_rate),
+    ).one()
+
+    sort_column = {
+        "userId": User.id,
+        "name": User.name,
+        "studentId": User.student_id,
+        "totalSessions": total_sessions,
+        "totalMinutes": total_minutes,
+        "correctRate": correct_rate,
+        "weeklyDays": weekly_days,
+    }[sort]
+    query = query.order_by(
+        sort_column.desc() if order == "desc" else sort_column.asc(),
+        User.id.asc(),
+    )
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
 
+    result = []
+    for student, sessions, minutes, rate, days in query.all():
         result.append({
             "userId": student.id,
             "studentId": student.student_id,
             "name": student.name,
             "phone": student.phone,
-            "totalSessions": stats.totalSessions,
-            "totalMinutes": stats.totalMinutes,
-            "correctRate": stats.correctRate,
-            "weeklyDays": stats.weeklyDays,
-            "meetsWeeklyGoal": stats.weeklyDays >= 3,
+            "totalSessions": sessions,
+            "totalMinutes": float(minutes),
+            "correctRate": float(rate),
+            "weeklyDays": days,
+            "meetsWeeklyGoal": days >= WEEKLY_GOAL_DAYS,
         })
 
-    return {"students": result, "generatedAt": now.isoformat()}
+    return {
+        "students": result,
+        "total": total,
+        "summary": {
+            "goalMet": goal_met,
+            "avgCorrectRate": round(float(avg_rate), 1) if avg_rate is not None else 0,
+        },
+        "generatedAt": now.isoformat(),
+    }
 
 
 @app.get("/api/admin/students/{student_id}/records", response_model=list[RecordResponse])
@@ -456,27 +666,34 @@ def update_threshold(
 
 # ── Serve frontend (production) ──────────────────────────
 
-_base = os.path.dirname(os.path.abspath(__file__))
-_static_dir = None
-for _candidate in [
-    os.path.join(_base, "..", "frontend", "dist"),
-    os.path.join(_base, "static"),
-]:
-    if os.path.isdir(_candidate):
-        _static_dir = _candidate
-        break
-
-if _static_dir:
+def _mount_frontend(app: FastAPI) -> None:
+    """Resolve the built SPA at startup and register it after all API routes."""
+    base = os.path.dirname(os.path.abspath(__file__))
+    static_dir = None
+    for candidate in [
+        os.path.join(base, "..", "frontend", "dist"),
+        os.path.join(base, "static"),
+    ]:
+        if os.path.isdir(candidate):
+            static_dir = candidate
+            break
+
+    if not static_dir:
+        return
+
     from fastapi.responses import FileResponse
 
-    app.mount("/assets", StaticFiles(directory=os.path.join(_static_dir, "assets")), name="assets")
+    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
 
     @app.get("/{full_path:path}")
     def serve_spa(full_path: str):
-        file_path = os.path.join(_static_dir, full_path)
+        file_path = os.path.join(static_dir, full_path)
         if full_path and os.path.isfile(file_path):
             return FileResponse(file_path)
-        return FileResponse(os.path.join(_static_dir, "index.html"))
+        return FileResponse(os.path.join(static_dir, "index.html"))
+
+
+startup_metrics["importSeconds"] = round(perf_counter() - _IMPORT_STARTED, 4)
 
 
 if __name__ == "__main__":
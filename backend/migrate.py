@@ -0,0 +1,15 @@
+"""
+Deploy-time migration step
+    cd backend && python migrate.py
+"""
+
+from database import get_engine
+from migrations import MIGRATIONS, upgrade
+
+
+if __name__ == "__main__":
+    applied = upgrade(get_engine())
+    if applied:
+        print(f"Applied migrations: {', '.join(map(str, applied))}")
+    else:
+        print(f"Schema up to date (version {MIGRATIONS[-1][0]})")
@@ -0,0 +1,160 @@
+"""
+Versioned schema migrations
+- 배포 시 `python migrate.py`로 한 번만 실행 (워커마다 DDL을 돌리지 않음)
+- 적용된 버전은 schema_version 테이블에 기록
+- 각 버전은 고정된 DDL: models.py를 바꾸면 새 버전을 추가할 것
+- Postgres에서는 advisory lock으로 직렬화, 그 외(로컬 SQLite)는 단일 프로세스 전용
+"""
+
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table,
+    select, text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+# pg_advisory_lock key shared by every process running upgrade()
+MIGRATION_LOCK_KEY = 0x4D6F6469  # "Modi"
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+# ── v1: baseline schema (models.py before versioned migrations) ──
+
+_baseline = MetaData()
+
+Table(
+    "users", _baseline,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("student_id", String(50), unique=True, nullable=False, index=True),
+    Column("name", String(100), nullable=False),
+    Column("phone", String(20), nullable=False),
+    Column("role", String(20), nullable=False),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "practice_records", _baseline,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("is_correct", Boolean, nullable=False),
+    Column("mse_score", Float, nullable=False),
+    Column("confidence", Float, nullable=False),
+    Column("duration_seconds", Integer, nullable=False),
+    Column("correct_rate", Float, nullable=False),
+    Column("memo", String(500), nullable=True),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "feedbacks", _baseline,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("admin_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("student_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("content", String(1000), nullable=False),
+    Column("week_label", String(20), nullable=True),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "app_settings", _baseline,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("key", String(100), unique=True, nullable=False, index=True),
+    Column("value", String(500), nullable=False),
+    Column("updated_by", Integer, ForeignKey("users.id"), nullable=True),
+    Column("updated_at", DateTime),
+)
+
+
+def _v1_initial(conn: Connection) -> None:
+    # checkfirst: databases created by the old import-time create_all already have this schema
+    _baseline.create_all(bind=conn, checkfirst=True)
+
+
+# ── Later versions: explicit DDL only ──
+
+def _v2_dashboard_indexes(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        # LIKE 'abc%' only uses a btree under non-C collations with *_pattern_ops
+        conn.execute(text("CREATE INDEX ix_users_name_prefix ON users (name varchar_pattern_ops)"))
+        conn.execute(text(
+            "CREATE INDEX ix_users_student_id_prefix ON users (student_id varchar_pattern_ops)"
+        ))
+    else:
+        conn.execute(text("CREATE INDEX ix_users_name_prefix ON users (name)"))
+    conn.execute(text(
+        "CREATE INDEX ix_practice_records_user_created ON practice_records (user_id, created_at)"
+    ))
+
+
+def _v3_drop_user_id_index(conn: Connection) -> None:
+    # ix_practice_records_user_created has user_id as its leading column
+    conn.execute(text("DROP INDEX ix_practice_records_user_id"))
+
+
+def _v4_lower_prefix_indexes(conn: Connection) -> None:
+    # Search matches lower(name) / lower(student_id) so Postgres and SQLite agree on case
+    conn.execute(text("DROP INDEX ix_users_name_prefix"))
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("DROP INDEX ix_users_student_id_prefix"))
+        ops = " text_pattern_ops"
+    else:
+        ops = ""
+    conn.execute(text(f"CREATE INDEX ix_users_name_lower_prefix ON users (lower(name){ops})"))
+    conn.execute(text(
+        f"CREATE INDEX ix_users_student_id_lower_prefix ON users (lower(student_id){ops})"
+    ))
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "initial schema", _v1_initial),
+    (2, "admin dashboard search indexes", _v2_dashboard_indexes),
+    (3, "drop redundant practice_records.user_id index", _v3_drop_user_id_index),
+    (4, "case-insensitive student search indexes", _v4_lower_prefix_indexes),
+]
+
+
+def current_version(conn: Connection) -> int:
+    schema_version.create(bind=conn, checkfirst=True)
+    versions = conn.execute(select(schema_version.c.version)).scalars().all()
+    return max(versions, default=0)
+
+
+def upgrade(engine: Engine) -> list[int]:
+    """Apply pending migrations in order, each in its own transaction."""
+    applied = []
+    with engine.connect() as conn:
+        locked = conn.dialect.name == "postgresql"
+        if locked:
+            # Session-level lock: a concurrent upgrade() waits here, then sees the new version
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            conn.commit()
+        try:
+            with conn.begin():
+                version = current_version(conn)
+
+            for number, description, migrate in MIGRATIONS:
+                if number <= version:
+                    continue
+                with conn.begin():
+                    migrate(conn)
+                    conn.execute(schema_version.insert().values(
+                        version=number,
+                        description=description,
+                        applied_at=datetime.now(timezone.utc),
+                    ))
+                applied.append(number)
+        finally:
+            if locked:
+                conn.rollback()
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                conn.commit()
+    return applied
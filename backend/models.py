@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from database import Base
@@ -16,12 +16,25 @@ class User(Base):
 
     records = relationship("PracticeRecord", back_populates="user")
 
+    # Case-insensitive prefix search on the admin dashboard (lower(col) LIKE 'abc%').
+    # Postgres only uses a btree for LIKE under non-C collations with *_pattern_ops.
+    __table_args__ = (
+        Index(
+            "ix_users_name_lower_prefix", func.lower(name).label("name_lower"),
+            postgresql_ops={"name_lower": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_users_student_id_lower_prefix", func.lower(student_id).label("student_id_lower"),
+            postgresql_ops={"student_id_lower": "text_pattern_ops"},
+        ),
+    )
+
 
 class PracticeRecord(Base):
     __tablename__ = "practice_records"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_correct = Column(Boolean, nullable=False)
     mse_score = Column(Float, nullable=False)
     confidence = Column(Float, nullable=False)
@@ -32,6 +45,12 @@ class PracticeRecord(Base):
 
     user = relationship("User", back_populates="records")
 
+    # Per-student aggregates and the 7-day window scan on the admin dashboard;
+    # also serves plain user_id lookups, so user_id has no index of its own.
+    __table_args__ = (
+        Index("ix_practice_records_user_created", "user_id", "created_at"),
+    )
+
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
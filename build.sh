@@ -13,3 +13,6 @@ cp -r dist/* ../backend/static/
 # Install backend dependencies
 cd ../backend
 pip install -r requirements.txt
+
+# Apply schema migrations once per deploy (not on every worker start)
+python migrate.py
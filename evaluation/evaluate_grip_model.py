@@ -0,0 +1,327 @@
+"""
+GraspFit grip autoencoder offline evaluation
+- grip_autoencoder.onnx로 라벨링된 랜드마크 데이터셋의 재구성 MSE 계산
+- 임계값 sweep: coverage, ROC / precision-recall, throughput (frames/sec)
+
+Dataset: .npy keypoints (N, 63) or (N, 21, 3), wrist-relative like
+keypointNormalizer.ts (use --raw for un-normalized MediaPipe landmarks).
+Optional .npy labels (N,): 1 = correct grip, 0 = incorrect grip.
+Without labels every frame is treated as a correct grip (coverage only).
+Arrays are memory-mapped and evaluated in chunks by a process pool.
+
+    python evaluate_grip_model.py \\
+        --dataset val=data/val_X.npy \\
+        --dataset test=data/test_X.npy,data/test_y.npy \\
+        --workers 8 --output report.json
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS_DIR = os.path.join(REPO_DIR, "frontend", "public", "models")
+DEFAULT_MODEL = os.path.join(MODELS_DIR, "grip_autoencoder.onnx")
+DEFAULT_META = os.path.join(MODELS_DIR, "model_meta.json")
+
+# Same bounds / step as PUT /api/settings/threshold and the admin slider
+SWEEP_MIN, SWEEP_MAX, SWEEP_STEP = 0.001, 0.05, 0.0001
+N_FEATURES = 63
+
+
+# ── Inference (runs inside worker processes) ──────────────
+
+_session = None
+_barrier = None
+_arrays: dict[str, np.ndarray] = {}
+
+
+def _init_worker(model_path: str, barrier=None) -> None:
+    global _session, _barrier
+    import onnxruntime as ort
+
+    _barrier = barrier
+
+    options = ort.SessionOptions()
+    # One process per core; let the pool provide the parallelism
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    _session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+
+def _ready(_: int) -> int:
+    # Each worker blocks here until all have a task, so no worker can take two
+    _barrier.wait(timeout=300)
+    return os.getpid()
+
+
+def _open_keypoints(path: str) -> np.ndarray:
+    if path not in _arrays:
+        array = np.load(path, mmap_mode="r")
+        _arrays[path] = array.reshape(array.shape[0], -1)
+    return _arrays[path]
+
+
+def _normalize(keypoints: np.ndarray) -> np.ndarray:
+    """Wrist-relative coordinates, as in keypointNormalizer.ts."""
+    points = keypoints.reshape(-1, 21, 3)
+    return (points - points[:, :1, :]).reshape(-1, N_FEATURES)
+
+
+def _chunk_mse(task: tuple[str, int, int, int, bool]) -> tuple[int, np.ndarray]:
+    path, start, stop, batch_size, raw = task
+    keypoints = _open_keypoints(path)
+    mse = np.empty(stop - start, dtype=np.float32)
+    for offset in range(start, stop, batch_size):
+        end = min(offset + batch_size, stop)
+        batch = np.asarray(keypoints[offset:end], dtype=np.float32)
+        if raw:
+            batch = _normalize(batch)
+        reconstructed = _session.run(["reconstructed"], {"keypoints": batch})[0]
+        # Same as calculateMSE in gripClassifier.ts
+        mse[offset - start:end - start] = np.mean(
+            np.square(batch - reconstructed, dtype=np.float64), axis=1
+        )
+    return start, mse
+
+
+def compute_mse(pool, keypoints_path: str, chunk_size: int, batch_size: int, raw: bool) -> np.ndarray:
+    keypoints = np.load(keypoints_path, mmap_mode="r")
+    n = keypoints.shape[0]
+    if keypoints.reshape(n, -1).shape[1] != N_FEATURES:
+        raise ValueError(f"{keypoints_path}: expected {N_FEATURES} values per frame, got shape {keypoints.shape}")
+
+    tasks = [
+        (keypoints_path, start, min(start + chunk_size, n), batch_size, raw)
+        for start in range(0, n, chunk_size)
+    ]
+    mse = np.empty(n, dtype=np.float32)
+    results = pool.map(_chunk_mse, tasks) if pool else map(_chunk_mse, tasks)
+    for start, chunk in results:
+        mse[start:start + len(chunk)] = chunk
+    return mse
+
+
+# ── Metrics ──────────────────────────────────────────────
+
+def sweep_thresholds(mse: np.ndarray, labels: np.ndarray, thresholds: np.ndarray) -> dict:
+    """Confusion counts for `mse <= t` (predicted correct grip) at every threshold."""
+    pos = np.sort(mse[labels])
+    neg = np.sort(mse[~labels])
+    tp = np.searchsorted(pos, thresholds, side="right")
+    fp = np.searchsorted(neg, thresholds, side="right")
+    fn = len(pos) - tp
+    tn = len(neg) - fp
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage = np.where(len(pos) > 0, tp / max(len(pos), 1), np.nan)
+        fpr = np.where(len(neg) > 0, fp / max(len(neg), 1), np.nan)
+        precision = np.where(tp + fp > 0, tp / np.maximum(tp + fp, 1), np.nan)
+        f1 = np.where(tp > 0, 2 * tp / np.maximum(2 * tp + fp + fn, 1), 0.0)
+
+    return {
+        "threshold": thresholds,
+        "coverage": coverage,  # = TPR / recall on correct grips
+        "fpr": fpr,
+        "precision": precision,
+        "f1": f1,
+        "tp": tp, "fp": fp, "tn": tn, "fn": fn,
+    }
+
+
+def roc_auc(mse: np.ndarray, labels: np.ndarray) -> float | None:
+    """P(correct grip scores lower MSE than incorrect grip), ties count half."""
+    pos = mse[labels]
+    neg = np.sort(mse[~labels])
+    if len(pos) == 0 or len(neg) == 0:
+        return None
+    lower = np.searchsorted(neg, pos, side="left")
+    upper = np.searchsorted(neg, pos, side="right")
+    wins = (len(neg) - upper).sum(dtype=np.float64) + 0.5 * (upper - lower).sum(dtype=np.float64)
+    return float(wins / (len(pos) * len(neg)))
+
+
+def average_precision(mse: np.ndarray, labels: np.ndarray) -> float | None:
+    """Area under the precision-recall curve over every distinct threshold."""
+    n_pos = int(labels.sum())
+    if n_pos == 0 or n_pos == len(labels):
+        return None
+    order = np.argsort(mse, kind="stable")
+    sorted_mse = mse[order]
+    tp = np.cumsum(labels[order])
+    # Evaluate only at the last index of each tied MSE value
+    last = np.r_[sorted_mse[1:] != sorted_mse[:-1], True]
+    tp = tp[last]
+    predicted = np.flatnonzero(last) + 1
+    recall_gain = np.diff(np.r_[0, tp]) / n_pos
+    return float(np.sum(recall_gain * tp / predicted))
+
+
+def evaluate_split(name: str, mse: np.ndarray, labels: np.ndarray, thresholds: np.ndarray,
+                   named_thresholds: dict[str, float], seconds: float) -> tuple[dict, dict]:
+    curve = sweep_thresholds(mse, labels, thresholds)
+    named = sweep_thresholds(mse, labels, np.array(list(named_thresholds.values())))
+    pos_mse = mse[labels]
+
+    report = {
+        "split": name,
+        "frames": int(len(mse)),
+        "correctGrips": int(labels.sum()),
+        "incorrectGrips": int((~labels).sum()),
+        "seconds": round(seconds, 3),
+        "framesPerSecond": round(len(mse) / seconds, 1) if seconds > 0 else None,
+        "rocAuc": roc_auc(mse, labels),
+        "averagePrecision": average_precision(mse, labels),
+        "thresholdP95": float(np.percentile(pos_mse, 95)) if len(pos_mse) else None,
+        "atThreshold": {
+            key: {metric: _jsonable(named[metric][i]) for metric in named if metric != "threshold"}
+            | {"threshold": value}
+            for i, (key, value) in enumerate(named_thresholds.items())
+        },
+    }
+    return report, curve
+
+
+def _jsonable(value):
+    value = value.item() if isinstance(value, np.generic) else value
+    return None if isinstance(value, float) and np.isnan(value) else value
+
+
+# ── CLI ──────────────────────────────────────────────────
+
+def _parse_dataset(spec: str) -> tuple[str, str, str | None]:
+    name, sep, paths = spec.partition("=")
+    if not sep:
+        name, paths = os.path.splitext(os.path.basename(spec))[0], spec
+    keypoints_path, _, labels_path = paths.partition(",")
+    return name, keypoints_path, labels_path or None
+
+
+def _load_labels(path: str | None, n: int) -> np.ndarray:
+    if path is None:
+        return np.ones(n, dtype=bool)
+    labels = np.load(path, mmap_mode="r").reshape(-1)
+    if len(labels) != n:
+        raise ValueError(f"{path}: {len(labels)} labels for {n} frames")
+    return np.asarray(labels) > 0
+
+
+def _write_curve(path: str, curves: dict[str, dict]) -> None:
+    columns = ["threshold", "coverage", "fpr", "precision", "f1", "tp", "fp", "tn", "fn"]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["split", *columns])
+        for split, curve in curves.items():
+            for i in range(len(curve["threshold"])):
+                writer.writerow([split, *(_jsonable(curve[c][i]) for c in columns)])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evaluate the grip autoencoder and MSE threshold offline")
+    parser.add_argument("--dataset", action="append", required=True,
+                        metavar="NAME=KEYPOINTS.npy[,LABELS.npy]")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--meta", default=DEFAULT_META)
+    parser.add_argument("--threshold", type=float, action="append", default=[],
+                        help="extra threshold to report (e.g. the current admin setting)")
+    parser.add_argument("--raw", action="store_true", help="keypoints are raw MediaPipe landmarks")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=262144, help="frames per pool task")
+    parser.add_argument("--batch-size", type=int, default=8192, help="frames per ONNX run")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--curve-csv", help="write the full threshold sweep here")
+    parser.add_argument("--save-mse", help="directory to save per-frame MSE arrays (<split>_mse.npy)")
+    args = parser.parse_args()
+
+    with open(args.meta, encoding="utf-8") as f:
+        meta = json.load(f)
+    named_thresholds = {"threshold_train95": meta["threshold_train95"]}
+    for value in args.threshold:
+        named_thresholds[f"threshold_{value:g}"] = value
+    thresholds = np.round(np.arange(SWEEP_MIN, SWEEP_MAX + SWEEP_STEP / 2, SWEEP_STEP), 6)
+
+    # Worker spawn + ONNX session creation is timed on its own, so that
+    # framesPerSecond of the first split only covers inference
+    started = time.perf_counter()
+    pool = None
+    if args.workers > 1:
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(args.workers)
+        pool = ProcessPoolExecutor(
+            args.workers, mp_context=context,
+            initializer=_init_worker, initargs=(args.model, barrier),
+        )
+        pids = set(pool.map(_ready, range(args.workers)))
+        if len(pids) != args.workers:
+            raise RuntimeError(f"only {len(pids)} of {args.workers} workers started")
+    else:
+        _init_worker(args.model)
+    startup_seconds = time.perf_counter() - started
+    print(f"{args.workers} worker(s) ready in {startup_seconds:.3f}s")
+
+    reports, curves = [], {}
+    try:
+        for spec in args.dataset:
+            name, keypoints_path, labels_path = _parse_dataset(spec)
+            started = time.perf_counter()
+            mse = compute_mse(pool, keypoints_path, args.chunk_size, args.batch_size, args.raw)
+            seconds = time.perf_counter() - started
+            labels = _load_labels(labels_path, len(mse))
+
+            if args.save_mse:
+                os.makedirs(args.save_mse, exist_ok=True)
+                np.save(os.path.join(args.save_mse, f"{name}_mse.npy"), mse)
+
+            report, curves[name] = evaluate_split(name, mse, labels, thresholds, named_thresholds, seconds)
+            reports.append(report)
+            _print_summary(report, meta)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    result = {
+        "model": os.path.abspath(args.model),
+        "workers": args.workers,
+        "workerStartupSeconds": round(startup_seconds, 3),
+        "sweep": {"min": SWEEP_MIN, "max": SWEEP_MAX, "step": SWEEP_STEP},
+        "splits": reports,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.curve_csv:
+        _write_curve(args.curve_csv, curves)
+    return 0
+
+
+def _fmt(value, digits: int = 4) -> str:
+    return "n/a" if value is None else f"{value:.{digits}f}"
+
+
+def _print_summary(report: dict, meta: dict) -> None:
+    print(f"[{report['split']}] {report['frames']} frames "
+          f"({report['correctGrips']} correct / {report['incorrectGrips']} incorrect), "
+          f"{report['framesPerSecond']} frames/s")
+    for key, stats in report["atThreshold"].items():
+        line = f"  {key}={stats['threshold']:.6f}: coverage {_fmt(stats['coverage'])}"
+        if stats["fpr"] is not None:
+            line += f", FPR {_fmt(stats['fpr'])}, precision {_fmt(stats['precision'])}, F1 {_fmt(stats['f1'])}"
+        print(line)
+    if report["rocAuc"] is not None:
+        print(f"  ROC AUC {_fmt(report['rocAuc'])}, average precision {_fmt(report['averagePrecision'])}")
+    if report["thresholdP95"] is not None:
+        print(f"  95th percentile MSE of correct grips: {report['thresholdP95']:.6f}")
+    recorded = meta.get(f"coverage_{report['split']}")
+    if recorded is not None:
+        print(f"  model_meta.json coverage_{report['split']}: {recorded:.4f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,8 +33,13 @@ export const api = {
     request<UserStats>(`/api/stats/${userId}`),
 
   // ── Admin ──
-  getStudents: (adminId: number) =>
-    request<{ students: AdminStudent[]; generatedAt: string }>(`/api/admin/students?admin_id=${adminId}`),
+  getStudents: (adminId: number, query: AdminStudentQuery = {}) => {
+    const params = new URLSearchParams({ admin_id: String(adminId) });
+    for (const [key, value] of Object.entries(query)) {
+      if (value !== undefined && value !== '') params.set(key, String(value));
+    }
+    return request<AdminStudentPage>(`/api/admin/students?${params}`);
+  },
 
   getStudentRecords: (studentId: number, adminId: number) =>
     request<PracticeRecord[]>(`/api/admin/students/${studentId}/records?admin_id=${adminId}`),
@@ -87,3 +92,25 @@ export interface AdminStudent {
   weeklyDays: number;
   meetsWeeklyGoal: boolean;
 }
+
+// One page of the admin student list; total / summary cover every matching student
+export interface AdminStudentPage {
+  students: AdminStudent[];
+  total: number;
+  summary: { goalMet: number; avgCorrectRate: number };
+  generatedAt: string;
+}
+
+// Server-side filter / sort / paging for the admin student list
+export interface AdminStudentQuery {
+  q?: string;
+  meets_weekly_goal?: boolean;
+  min_correct_rate?: number;
+  max_correct_rate?: number;
+  min_total_minutes?: number;
+  max_total_minutes?: number;
+  sort?: 'userId' | 'name' | 'studentId' | 'totalSessions' | 'totalMinutes' | 'correctRate' | 'weeklyDays';
+  order?: 'asc' | 'desc';
+  limit?: number;
+  offset?: number;
+}
@@ -1,22 +1,54 @@
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
-import { api, type AdminStudent } from '../lib/api';
+import { api, type AdminStudent, type AdminStudentQuery } from '../lib/api';
 import type { PracticeRecord, FeedbackItem } from '../types';
 import Modal from '../components/common/Modal';
 import {
   LogOut, Users, CheckCircle, TrendingUp,
   Clock, BarChart3, Send, MessageSquare,
-  ChevronRight, Award, AlertCircle, BookOpen, Sliders,
+  ChevronRight, Award, AlertCircle, BookOpen, Sliders, Search,
 } from 'lucide-react';
 import './AdminPage.css';
 
+const PAGE_SIZE = 20;
+
+type GoalFilter = 'all' | 'met' | 'not';
+
+const SORT_OPTIONS: { value: string; label: string; sort: AdminStudentQuery['sort']; order: AdminStudentQuery['order'] }[] = [
+  { value: 'name', label: '이름순', sort: 'name', order: 'asc' },
+  { value: 'rate-asc', label: '정확도 낮은순', sort: 'correctRate', order: 'asc' },
+  { value: 'rate-desc', label: '정확도 높은순', sort: 'correctRate', order: 'desc' },
+  { value: 'minutes-asc', label: '연습시간 적은순', sort: 'totalMinutes', order: 'asc' },
+  { value: 'minutes-desc', label: '연습시간 많은순', sort: 'totalMinutes', order: 'desc' },
+];
+
+function studentQuery(search: string, goalFilter: GoalFilter, sortValue: string, offset: number): AdminStudentQuery {
+  const sortOption = SORT_OPTIONS.find((o) => o.value === sortValue) ?? SORT_OPTIONS[0];
+  return {
+    q: search.trim() || undefined,
+    meets_weekly_goal: goalFilter === 'all' ? undefined : goalFilter === 'met',
+    sort: sortOption.sort,
+    order: sortOption.order,
+    limit: PAGE_SIZE,
+    offset,
+  };
+}
+
 export default function AdminPage() {
   const { user, logout } = useAuth();
   const navigate = useNavigate();
   const [students, setStudents] = useState<AdminStudent[]>([]);
   const [loading, setLoading] = useState(true);
 
+  // Server-side search / filter / sort / paging
+  const [search, setSearch] = useState('');
+  const [goalFilter, setGoalFilter] = useState<GoalFilter>('all');
+  const [sortValue, setSortValue] = useState('name');
+  const [total, setTotal] = useState(0);
+  const [summary, setSummary] = useState({ goalMet: 0, avgCorrectRate: 0 });
+  const [loadingMore, setLoadingMore] = useState(false);
+
   // Detail modal
   const [selectedStudent, setSelectedStudent] = useState<AdminStudent | null>(null);
   const [studentRecords, setStudentRecords] = useState<PracticeRecord[]>([]);
@@ -31,19 +63,55 @@ export default function AdminPage() {
   const [thresholdSaving, setThresholdSaving] = useState(false);
 
   useEffect(() => {
-    if (user?.id) {
-      api.getStudents(user.id)
-        .then((data) => setStudents(data.students))
+    const adminId = user?.id;
+    if (!adminId) return;
+    let cancelled = false;
+    // Debounce typing; filter / sort changes fetch right away
+    const timer = setTimeout(() => {
+      setLoading(true);
+      api.getStudents(adminId, studentQuery(search, goalFilter, sortValue, 0))
+        .then((data) => {
+          if (cancelled) return;
+          setStudents(data.students);
+          setTotal(data.total);
+          setSummary(data.summary);
+        })
         .catch(console.error)
-        .finally(() => setLoading(false));
-    }
+        .finally(() => {
+          if (!cancelled) setLoading(false);
+        });
+    }, search.trim() ? 300 : 0);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [user?.id, search, goalFilter, sortValue]);
+
+  useEffect(() => {
     api.getThreshold()
       .then((data) => {
         setCurrentThreshold(data.threshold);
         setSliderValue(data.threshold);
       })
       .catch(console.error);
-  }, [user?.id]);
+  }, []);
+
+  const handleLoadMore = async () => {
+    if (!user?.id) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getStudents(
+        user.id,
+        studentQuery(search, goalFilter, sortValue, students.length),
+      );
+      setStudents((prev) => [...prev, ...data.students]);
+      setTotal(data.total);
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleSaveThreshold = async () => {
     if (!user?.id) return;
@@ -103,11 +171,10 @@ export default function AdminPage() {
     }
   };
 
-  const totalStudents = students.length;
-  const goalMet = students.filter((s) => s.meetsWeeklyGoal).length;
-  const avgRate = totalStudents > 0
-    ? Math.round(students.reduce((sum, s) => sum + s.correctRate, 0) / totalStudents)
-    : 0;
+  const isFiltered = search.trim() !== '' || goalFilter !== 'all';
+  const totalStudents = total;
+  const goalMet = summary.goalMet;
+  const avgRate = Math.round(summary.avgCorrectRate);
 
   return (
     <div className="admin-page">
@@ -141,7 +208,7 @@ export default function AdminPage() {
               <Users size={20} />
             </div>
             <span className="summary-value">{totalStudents}</span>
-            <span className="summary-label">전체 학생</span>
+            <span className="summary-label">{isFiltered ? '검색된 학생' : '전체 학생'}</span>
           </div>
           <div className="summary-card">
             <div className="summary-icon summary-icon-goal">
@@ -195,12 +262,42 @@ export default function AdminPage() {
         {/* Student list */}
         <h2 className="section-heading">학생 목록</h2>
 
+        <div className="student-filters">
+          <label className="student-search">
+            <Search size={16} />
+            <input
+              type="search"
+              placeholder="이름 또는 학번으로 검색"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+            />
+          </label>
+          <select
+            className="student-filter-select"
+            value={goalFilter}
+            onChange={(e) => setGoalFilter(e.target.value as GoalFilter)}
+          >
+            <option value="all">전체</option>
+            <option value="met">목표 달성</option>
+            <option value="not">미달성</option>
+          </select>
+          <select
+            className="student-filter-select"
+            value={sortValue}
+            onChange={(e) => setSortValue(e.target.value)}
+          >
+            {SORT_OPTIONS.map((o) => (
+              <option key={o.value} value={o.value}>{o.label}</option>
+            ))}
+          </select>
+        </div>
+
         {loading ? (
           <div className="admin-loading">데이터를 불러오는 중...</div>
         ) : students.length === 0 ? (
           <div className="admin-empty">
             <AlertCircle size={32} />
-            <p>등록된 학생이 없습니다.</p>
+            <p>{isFiltered ? '조건에 맞는 학생이 없습니다.' : '등록된 학생이 없습니다.'}</p>
           </div>
         ) : (
           <div className="student-list">
@@ -233,6 +330,15 @@ export default function AdminPage() {
                 <ChevronRight size={16} className="student-chevron" />
               </button>
             ))}
+            {students.length < total && (
+              <button
+                className="student-load-more"
+                onClick={handleLoadMore}
+                disabled={loadingMore}
+              >
+                {loadingMore ? '불러오는 중...' : `더 보기 (${students.length}/${total})`}
+              </button>
+            )}
           </div>
         )}
 